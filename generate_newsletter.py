@@ -1,10 +1,17 @@
-import json
+import asyncio
+import functools
+import hashlib
 import re
+import shelve
+import threading
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from html import escape
 
+import aiohttp  # pip3 install aiohttp
+import orjson  # pip3 install orjson
 import requests  # pip3 install requests
 from resend import Resend  # pip3 install resend
 
@@ -20,7 +27,28 @@ ISSUE_DATE = "November 26, 2025"
 ISSUE_NUMBER = "0001"
 
 OLLAMA_MODEL = "llama3.2"
+OLLAMA_FORMAT = "json"  # Ollama constrains output to valid JSON (the fused prompt is parsed as JSON)
 MAX_CHARS_FOR_AI = 2000
+AI_MIN_CONTENT_CHARS = 400  # Shorter articles use simple_summary without calling Ollama
+
+# Max concurrent Ollama requests. Match the server's OLLAMA_NUM_PARALLEL setting
+# (e.g. `OLLAMA_NUM_PARALLEL=4 ollama serve`) so requests overlap instead of queueing.
+# The server treats 0 as "auto"; the client needs at least one worker.
+OLLAMA_NUM_PARALLEL = max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+
+# One pooled keep-alive session for all Ollama calls (avoids a new TCP connection per request).
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    # One pooled connection per worker thread, so none are discarded
+    requests.adapters.HTTPAdapter(pool_maxsize=OLLAMA_NUM_PARALLEL, max_retries=0),
+)
+SESSION.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+
+# On-disk cache of parsed LLM responses, keyed by SHA256(model + format + prompt). Enable with LLM_CACHE=1
+# to skip Ollama for unchanged articles on re-runs.
+LLM_CACHE = os.getenv("LLM_CACHE", "0") == "1"
+LLM_CACHE_PATH = Path(".llm_cache")
 
 # Test mode (limit number of articles while developing)
 TEST_MODE = True
@@ -32,12 +60,30 @@ RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")  # Get from environment variabl
 SENDER_EMAIL = os.getenv("SENDER_EMAIL", "newsletter@yourdomain.com")  # Your verified domain email
 SENDER_NAME = "The M&A Letter"
 EMAIL_SUBJECT = f"The M&A Letter - Issue {ISSUE_NUMBER} ({ISSUE_DATE})"
+EMAIL_BATCH_SIZE = 100  # Resend batch API accepts up to 100 emails per request
+EMAIL_CONCURRENCY = 20  # Max in-flight requests when sending one email per request (also rate-limited)
+RESEND_EMAILS_URL = "https://api.resend.com/emails"
+RESEND_RATE_LIMIT = 2  # Resend's default API limit (requests per second); raise if your plan allows more
+EMAIL_MAX_RETRIES = 3  # Retries per request after HTTP 429 (rate limited)
+
+
+# ---------- PRECOMPILED PATTERNS ----------
+_DATE_RE = re.compile(r"([A-Z][a-z]{2,9}\.?) +(\d{1,2}), *(\d{4})")
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_VALUE_RE = re.compile(
+    r"(?:USD|US\$|\$|EUR|€|GBP|£|C\$|CAD|INR|Rs\.?)\s*[0-9][0-9,]*(?:\.\d+)?\s*(?:million|billion|bn|mn|m|M|B)?",
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
+_ORG_SPLIT_RE = re.compile(r"&|,|/| and ")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_TEMPLATE_FIELD_RE = re.compile(r"\{\{(\w+)\}\}")
+_CAP_WORD_RE = re.compile(r"\b[A-Z][\w&.-]*\s+[A-Z][\w&.-]*")
 
 
 # ---------- LOAD ARTICLES ----------
 def load_articles(json_path: Path):
-    with json_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(json_path.read_bytes())
 
 
 # ---------- DATE HANDLING ----------
@@ -65,32 +111,39 @@ def extract_date_from_timestamp_list(timestamp_list):
     if not timestamp_list:
         return ""
     ts = timestamp_list[0]
-    m = re.search(r"([A-Z][a-z]{2,9}\.?)[ ]+(\d{1,2}),[ ]*(\d{4})", ts)
+    m = _DATE_RE.search(ts)
     if m:
         month_raw, day, year = m.groups()
         return f"{normalize_month(month_raw)} {int(day)}, {year}"
     return ""
 
 
-def extract_date_from_content(content: str) -> str:
-    text = " ".join(content.split())
-    m = re.search(r"([A-Z][a-z]{2,9}\.?)[ ]+(\d{1,2}),[ ]*(\d{4})", text)
+def normalize_whitespace(content: str) -> str:
+    """Collapse all whitespace runs to single spaces (computed once per article and reused)."""
+    return _WS_RE.sub(" ", content).strip()
+
+
+def extract_date_from_content(text: str) -> str:
+    """Expects whitespace-normalized text (see normalize_whitespace)."""
+    m = _DATE_RE.search(text)
     if not m:
         return ""
     month_raw, day, year = m.groups()
     return f"{normalize_month(month_raw)} {int(day)}, {year}"
 
 
-def get_pretty_date(article: dict) -> str:
+def get_pretty_date(article: dict, text=None) -> str:
+    """text: the article's already whitespace-normalized content, if the caller has it."""
     ts_date = extract_date_from_timestamp_list(article.get("timestamp", []))
     if ts_date:
         return ts_date
-    return extract_date_from_content(article.get("content", "") or "")
+    if text is None:
+        text = normalize_whitespace(article.get("content", "") or "")
+    return extract_date_from_content(text)
 
 
 # ---------- FALLBACK SUMMARY ----------
-def strip_prnewswire_boilerplate(content: str) -> str:
-    text = " ".join(content.split())
+def strip_prnewswire_boilerplate(text: str) -> str:
     marker = "/PRNewswire"
     idx = text.find(marker)
     if idx != -1:
@@ -101,14 +154,15 @@ def strip_prnewswire_boilerplate(content: str) -> str:
     return text
 
 
-def simple_summary(content: str, max_chars=400):
+def simple_summary(text: str, max_chars=400):
     """
     Deterministic 1–2 sentence summary, directly from the press release (no AI).
+    Expects whitespace-normalized text (see normalize_whitespace).
     """
-    core = strip_prnewswire_boilerplate(content)
+    core = strip_prnewswire_boilerplate(text)
     if not core:
         return ""
-    sentences = re.split(r"(?<=[.!?])\s+", core)
+    sentences = _SENT_SPLIT_RE.split(core)
     summary = " ".join(sentences[:2]).strip()
     if len(summary) > max_chars:
         short = summary[:max_chars]
@@ -119,68 +173,6 @@ def simple_summary(content: str, max_chars=400):
     return summary
 
 
-# ---------- AI SUMMARY (CONTEXT, DATAVISION STYLE, NO DATE PREFIX) ----------
-def ai_summarise_with_ollama(content: str, date_str: str) -> str:
-    """
-    Produce a 2–3 sentence summary in the style of the sample M&A Letter.
-
-    IMPORTANT:
-    - Do NOT start the summary with the date. The date will be shown separately in the layout.
-    - First sentence should start with the buyer or key company name where possible.
-    """
-    if not content:
-        return ""
-    content_for_ai = content[:MAX_CHARS_FOR_AI]
-
-    prompt = f"""
-You are an expert M&A and corporate development analyst.
-
-Write ONE concise news-style summary of the following M&A press release,
-in the style of a professional deals newsletter.
-
-CONTEXT (not for display):
-- The announcement date is: {date_str}
-- The date will be displayed separately in the newsletter layout.
-
-STRUCTURE:
-- The output MUST be 2 or 3 sentences in total.
-- DO NOT begin the text with a date like "{date_str}," or "Nov 3, 2025".
-- Prefer to start the first sentence with the main company or buyer name.
-  Example pattern: "Altimetrik completed the acquisition of SLK Software, creating ..."
-
-- First sentence: clearly classify the transaction (e.g., acquisition, strategic investment, merger,
-  buyback, joint venture) and name the key parties and the sector or space.
-- Second and (if needed) third sentence: describe scale and strategic rationale:
-  * scale examples: number of employees, countries, customers, segments, or (only if in the text) deal value
-  * rationale examples: expanding into new markets, strengthening AI/digital capabilities,
-    deepening presence in specific verticals, improving operational efficiency, providing liquidity to employees, etc.
-
-NUMBERS AND DEAL VALUE:
-- ONLY mention a specific financial amount (e.g., "USD 240 million") if that exact or equivalent value
-  is explicitly stated in the article text.
-- If there is no clear deal value mentioned, DO NOT invent or approximate any number.
-- DO NOT use placeholders like "$X million" or "an undisclosed amount".
-
-STYLE:
-- Tone: analytical, concise, business-like (no hype, no marketing adjectives).
-- Do NOT mention "/PRNewswire/", cities, or phrases like "according to the press release".
-- No bullet points; keep everything as continuous prose in 2–3 sentences.
-
-Press release:
-\"\"\"{content_for_ai}\"\"\"
-"""
-    try:
-        resp = requests.post(
-            "http://localhost:11434/api/generate",
-            json={"model": OLLAMA_MODEL, "prompt": prompt, "stream": False},
-            timeout=120,
-        )
-        resp.raise_for_status()
-        return (resp.json().get("response") or "").strip()
-    except Exception:
-        return ""
-
-
 # ---------- SANITY CHECK: DOES SUMMARY MATCH TITLE? ----------
 def summary_matches_title(summary: str, title: str) -> bool:
     """
@@ -190,46 +182,17 @@ def summary_matches_title(summary: str, title: str) -> bool:
     if not summary or not title:
         return False
 
-    summary_l = summary.lower()
-    # Take significant tokens from the title (no stopwords / tiny words)
-    tokens = [
-        t.strip(" ,.&()/-")
-        for t in title.split()
-        if len(t.strip(" ,.&()/-")) >= 4  # ignore very short words
-    ]
-
-    if not tokens:
+    # Significant title words (no stopwords / tiny words) vs. all summary words: one set intersection
+    title_tokens = {t for t in _WORD_RE.findall(title.lower()) if len(t) >= 4}
+    if not title_tokens:
         return False
 
-    for t in tokens:
-        if t.lower() in summary_l:
-            return True
-
-    return False
-
-
-def get_context_text(article: dict) -> str:
-    """
-    Try AI summary first, but only keep it if it clearly matches the deal title.
-    Otherwise fall back to deterministic summary from the press release.
-    """
-    content = article.get("content", "") or ""
-    pretty_date = get_pretty_date(article)
-    title = article.get("title", "") or ""
-
-    # 1) Try AI
-    if content:
-        ai_line = ai_summarise_with_ollama(content, pretty_date)
-        if ai_line and summary_matches_title(ai_line, title):
-            return ai_line
-
-    # 2) Fallback: deterministic summary from text
-    fallback = simple_summary(content)
-    return fallback
+    summary_tokens = set(_WORD_RE.findall(summary.lower()))
+    return bool(title_tokens & summary_tokens)
 
 
 # ---------- DEAL VALUE FROM TEXT (NO AI) ----------
-def extract_deal_value_from_text(content: str) -> str:
+def extract_deal_value_from_text(text: str) -> str:
     """
     Extract a deal value only if it actually appears in the text.
     Patterns like:
@@ -238,36 +201,114 @@ def extract_deal_value_from_text(content: str) -> str:
       - EUR 2.5 billion
       - C$3.4 billion
     If nothing found -> "NA".
+    Expects whitespace-normalized text (see normalize_whitespace).
     """
-    if not content:
+    if not text:
         return "NA"
 
-    text = " ".join(content.split())
-
-    pattern = r"""(
-        (?:USD|US\$|\$|EUR|€|GBP|£|C\$|CAD|INR|Rs\.?)
-        \s*
-        [0-9][0-9,]*(?:\.\d+)?
-        \s*
-        (?:million|billion|bn|mn|m|M|B)?
-    )"""
-
-    m = re.search(pattern, text, re.IGNORECASE | re.VERBOSE)
+    m = _VALUE_RE.search(text)
     if not m:
         return "NA"
 
-    value = m.group(1).strip()
+    value = m.group(0).strip()
 
     value = value.replace("US$", "USD ")
     value = value.replace("$", "USD ")
 
-    value = re.sub(r"\s+", " ", value).strip()
+    value = _WS_RE.sub(" ", value).strip()
     return value
 
 
-# ---------- AI METADATA EXTRACTION (ADVISOR + LEADERS, STRICT) ----------
-def ai_extract_deal_metadata(content: str) -> dict:
+# ---------- OLLAMA + LLM RESPONSE CACHE ----------
+_llm_cache_lock = threading.Lock()
+
+
+def _llm_cache_key(prompt: str) -> str:
+    return hashlib.sha256((OLLAMA_MODEL + "\0" + OLLAMA_FORMAT + "\0" + prompt).encode("utf-8")).hexdigest()
+
+
+def _llm_cache_get(key: str):
+    if not LLM_CACHE:
+        return None
+    with _llm_cache_lock, shelve.open(str(LLM_CACHE_PATH)) as db:
+        return db.get(key)
+
+
+def _llm_cache_put(key: str, value) -> None:
+    if not LLM_CACHE:
+        return
+    with _llm_cache_lock, shelve.open(str(LLM_CACHE_PATH)) as db:
+        db[key] = value
+
+
+def ollama_generate(prompt: str) -> str:
+    """
+    Return the raw Ollama response for a prompt. Raises on HTTP errors.
+    Not cached here: callers cache only responses they could parse.
+    """
+    resp = SESSION.post(
+        "http://localhost:11434/api/generate",
+        json={"model": OLLAMA_MODEL, "prompt": prompt, "stream": False, "format": OLLAMA_FORMAT},
+        timeout=120,
+    )
+    resp.raise_for_status()
+    return (orjson.loads(resp.content).get("response") or "").strip()
+
+
+def _extract_first_json(s: str) -> str:
+    """
+    Return the first balanced {...} object in s ("" if none), using a single linear scan
+    that tracks brace depth and skips braces inside JSON string literals.
     """
+    start = s.find("{")
+    if start == -1:
+        return ""
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(s)):
+        ch = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+    return ""
+
+
+def _trim(content: str, n: int) -> str:
+    """
+    Cut content to at most n chars for the prompt, ending on the last full sentence
+    (or at least a word boundary) instead of mid-word.
+    """
+    if len(content) <= n:
+        return content
+    s = content[:n]
+    cut = s.rfind(". ")
+    if cut > n // 2:
+        return s[:cut + 1]
+    space = s.rfind(" ")
+    return s[:space] if space > 0 else s
+
+
+# ---------- AI EXTRACTION (SUMMARY + ADVISOR + LEADERS, ONE CALL) ----------
+def ai_extract_all(article: dict) -> dict:
+    """
+    Single Ollama call per article that returns both the newsletter summary and the deal metadata.
+
+    - pretty_date: display date (timestamp, else first date in the text), reused by build_deal_block
+    - context: AI summary in the style of the sample M&A Letter (no date prefix), kept only if it
+      clearly matches the deal title; otherwise falls back to simple_summary.
     - deal_value: regex from text (no AI hallucination)
     - AI proposes:
         investor_or_pe, buyer, seller, advisor_firm,
@@ -277,9 +318,23 @@ def ai_extract_deal_metadata(content: str) -> dict:
       We keep values only if they appear in the article text.
       Roles are NOT normalized (e.g., Partner stays Partner, not CEO).
     """
-    if not content:
+    content = article.get("content", "") or ""
+    title = article.get("title", "") or ""
+
+    # Whitespace-normalize once and share it across the text helpers
+    text = normalize_whitespace(content)
+    # Computed once here and stored on the article for build_deal_block
+    date_str = get_pretty_date(article, text)
+
+    # Empty, very short, or low-signal (no money amount, no multi-word proper name) articles
+    # skip Ollama: the deterministic summary is as good, and there is nothing to extract.
+    if len(content) < AI_MIN_CONTENT_CHARS or not (
+        _VALUE_RE.search(text) or _CAP_WORD_RE.search(text[:2000])
+    ):
         return {
-            "deal_value": "NA",
+            "pretty_date": date_str,
+            "context": simple_summary(text),
+            "deal_value": extract_deal_value_from_text(text),
             "deal_advisor": "NA",
             "investor_or_pe": "NA",
             "buyer": "NA",
@@ -292,17 +347,20 @@ def ai_extract_deal_metadata(content: str) -> dict:
             "seller_lead_role": "NA",
         }
 
-    deal_value = extract_deal_value_from_text(content)
-    content_norm = " ".join(content.split()).lower()
+    deal_value = extract_deal_value_from_text(text)
+    # Word set of the article, so validators test membership instead of scanning the text
+    content_tokens = frozenset(_WORD_RE.findall(content.lower()))
 
-    content_for_ai = content[:MAX_CHARS_FOR_AI]
+    content_for_ai = _trim(content, MAX_CHARS_FOR_AI)
 
     prompt = f"""
-You are an M&A analyst. Read the following press release and identify the key firms and their senior representatives.
+You are an expert M&A and corporate development analyst. Read the following press release,
+write a short newsletter summary of it, and identify the key firms and their senior representatives.
 
 Return ONLY a JSON object with this exact shape:
 
 {{
+  "summary": "...",
   "investor_or_pe": "...",
   "buyer": "...",
   "seller": "...",
@@ -315,7 +373,37 @@ Return ONLY a JSON object with this exact shape:
   "seller_lead_role": "..."
 }}
 
-Definitions and rules:
+"summary" — ONE concise news-style summary, in the style of a professional deals newsletter.
+
+CONTEXT (not for display):
+- The announcement date is: {date_str}
+- The date will be displayed separately in the newsletter layout.
+
+STRUCTURE:
+- The summary MUST be 2 or 3 sentences in total.
+- DO NOT begin the text with a date like "{date_str}," or "Nov 3, 2025".
+- Prefer to start the first sentence with the main company or buyer name.
+  Example pattern: "Altimetrik completed the acquisition of SLK Software, creating ..."
+
+- First sentence: clearly classify the transaction (e.g., acquisition, strategic investment, merger,
+  buyback, joint venture) and name the key parties and the sector or space.
+- Second and (if needed) third sentence: describe scale and strategic rationale:
+  * scale examples: number of employees, countries, customers, segments, or (only if in the text) deal value
+  * rationale examples: expanding into new markets, strengthening AI/digital capabilities,
+    deepening presence in specific verticals, improving operational efficiency, providing liquidity to employees, etc.
+
+NUMBERS AND DEAL VALUE:
+- ONLY mention a specific financial amount (e.g., "USD 240 million") if that exact or equivalent value
+  is explicitly stated in the article text.
+- If there is no clear deal value mentioned, DO NOT invent or approximate any number.
+- DO NOT use placeholders like "$X million" or "an undisclosed amount".
+
+STYLE:
+- Tone: analytical, concise, business-like (no hype, no marketing adjectives).
+- Do NOT mention "/PRNewswire/", cities, or phrases like "according to the press release".
+- No bullet points; keep everything as continuous prose in 2–3 sentences.
+
+Metadata definitions and rules:
 - "investor_or_pe" = private equity or VC firm(s). If multiple, join with " & ".
 - "buyer" = acquiring company. If multiple, join with " & ".
 - "seller" = target company. If multiple, join with " & ".
@@ -333,27 +421,39 @@ Important:
 - DO NOT upgrade or relabel roles. For example, if the text says "Partner", keep "Partner" (do NOT change it to "CEO").
 - Values must be short, clean names or titles (no surrounding sentences, no labels like "CEO of", no company names mixed in).
 - If unsure, use "NA".
-    
+
 Press release:
 \"\"\"{content_for_ai}\"\"\"
 """
-    try:
-        resp = requests.post(
-            "http://localhost:11434/api/generate",
-            json={"model": OLLAMA_MODEL, "prompt": prompt, "stream": False},
-            timeout=120,
-        )
-        resp.raise_for_status()
-        raw = (resp.json().get("response") or "").strip()
-        match = re.search(r"\{.*\}", raw, re.DOTALL)
-        if not match:
-            raise ValueError("JSON not found in AI response")
-        data = json.loads(match.group(0))
-    except Exception:
-        data = {}
-
-    def clean(val: str) -> str:
-        if not val:
+    # Only successfully parsed responses are cached, so a malformed reply is retried next run
+    parsed_key = _llm_cache_key(prompt) + ":json"
+    data = _llm_cache_get(parsed_key)
+    if data is None:
+        try:
+            raw = ollama_generate(prompt)
+            json_text = _extract_first_json(raw)
+            if not json_text:
+                raise ValueError("JSON not found in AI response")
+            data = orjson.loads(json_text)
+            if not isinstance(data, dict):
+                raise ValueError("AI response JSON is not an object")
+            _llm_cache_put(parsed_key, data)
+        except Exception as e:
+            print(f"   ⚠️  AI extraction failed for {title[:60]!r}, using fallback: {str(e)}")
+            data = {}
+
+    # Keep the AI summary only if it clearly matches the deal title;
+    # otherwise fall back to a deterministic summary from the press release.
+    summary = data.get("summary")
+    summary = summary.strip() if isinstance(summary, str) else ""
+    if not summary_matches_title(summary, title):
+        summary = simple_summary(text)
+
+    # JSON mode can return lists ("If multiple, join ...") or non-strings; only keep text
+    def clean(val) -> str:
+        if isinstance(val, list):
+            val = " & ".join(v.strip() for v in val if isinstance(v, str) and v.strip())
+        if not isinstance(val, str):
             return "NA"
         s = val.strip()
         return s if s else "NA"
@@ -370,13 +470,13 @@ Press release:
     seller_lead_name = clean(data.get("seller_lead_name", "NA"))
     seller_lead_role = clean(data.get("seller_lead_role", "NA"))
 
-    # validate org-like names: require at least one token to appear in text
+    # validate org-like names: require at least one org (all of its words) to appear in text
     def validate_org(name: str) -> str:
         if name == "NA":
             return "NA"
-        parts = [p.strip() for p in re.split(r"&|,|/| and ", name) if p.strip()]
-        for p in parts:
-            if p.lower() in content_norm:
+        for p in _ORG_SPLIT_RE.split(name):
+            words = _WORD_RE.findall(p.lower())
+            if words and all(w in content_tokens for w in words):
                 return name
         return "NA"
 
@@ -384,9 +484,8 @@ Press release:
     def validate_person(name: str) -> str:
         if name == "NA":
             return "NA"
-        tokens = [t for t in re.split(r"\s+", name) if len(t) > 2]
-        for t in tokens:
-            if t.lower() in content_norm:
+        for t in _WORD_RE.findall(name.lower()):
+            if len(t) > 2 and t in content_tokens:
                 return name
         return "NA"
 
@@ -394,9 +493,8 @@ Press release:
     def validate_role(role: str) -> str:
         if role == "NA":
             return "NA"
-        tokens = [t for t in re.split(r"[\s/&,-]+", role) if len(t) > 2]
-        for t in tokens:
-            if t.lower() in content_norm:
+        for t in _WORD_RE.findall(role.lower()):
+            if len(t) > 2 and t in content_tokens:
                 return role
         return "NA"
 
@@ -426,6 +524,8 @@ Press release:
         deal_advisor = "NA"
 
     return {
+        "pretty_date": date_str,
+        "context": summary,
         "deal_value": deal_value,
         "deal_advisor": deal_advisor,
         "investor_or_pe": investor_or_pe,
@@ -441,104 +541,120 @@ Press release:
 
 
 # ---------- DEAL BLOCK (HEADLINE AS LINK + LEADERSHIP ROW) ----------
+_DEAL_TEMPLATE = """
+    <div class="deal-block">
+      <div class="deal-title-main">
+        <a href="{url}" target="_blank" style="color: #000; text-decoration: none;">
+          {title}
+        </a>
+      </div>
+
+      <div class="deal-meta-row">
+        <div class="deal-meta-left">{pretty_date}</div>
+        <div class="deal-meta-center"><span class="deal-meta-label">Deal Advisor:</span> {deal_advisor}</div>
+        <div class="deal-meta-right"><span class="deal-meta-label">Deal Value:</span> {deal_value}</div>
+      </div>
+
+      <div class="deal-body">{context}</div>
+      {footer_row_html}
+    </div>
+    """
+
+_DEAL_FIELDS = (
+    "title", "context", "url", "pretty_date", "deal_advisor", "deal_value",
+    "buyer", "seller", "investor_or_pe",
+    "buyer_lead_name", "buyer_lead_role",
+    "investor_lead_name", "investor_lead_role",
+    "seller_lead_name", "seller_lead_role",
+)
+_DEAL_FIELD_DEFAULTS = {"title": "Untitled deal", "context": "", "url": "#"}  # others: "NA"
+
+_DEAL_FOOTER_OPEN = """
+      <div class="deal-footer-row">
+        """
+_DEAL_FOOTER_CLOSE = """
+      </div>
+    """
+
+
 def build_deal_block(article: dict) -> str:
-    title = article.get("title", "Untitled deal")
-    context_text = article.get("context", "")
-    url = article.get("url", "#")
-    pretty_date = get_pretty_date(article)
-
-    title_html = escape(title)
-    body_html = escape(context_text)
-    url_html = escape(url)
-    date_html = escape(pretty_date)
-
-    deal_advisor = escape(article.get("deal_advisor", "NA"))
-    deal_value = escape(article.get("deal_value", "NA"))
-
-    buyer = article.get("buyer", "NA")
-    seller = article.get("seller", "NA")
-    investor_or_pe = article.get("investor_or_pe", "NA")
-
-    buyer_lead_name = article.get("buyer_lead_name", "NA")
-    buyer_lead_role = article.get("buyer_lead_role", "NA")
-    investor_lead_name = article.get("investor_lead_name", "NA")
-    investor_lead_role = article.get("investor_lead_role", "NA")
-    seller_lead_name = article.get("seller_lead_name", "NA")
-    seller_lead_role = article.get("seller_lead_role", "NA")
+    if "pretty_date" not in article:
+        article = {**article, "pretty_date": get_pretty_date(article)}
+
+    # Escape every display field once; footer labels are composed from the escaped parts
+    # (missing or None values fall back to the field default; empty strings stay empty)
+    esc = {
+        k: escape(v if (v := article.get(k)) is not None else _DEAL_FIELD_DEFAULTS.get(k, "NA"))
+        for k in _DEAL_FIELDS
+    }
 
     labels = []
 
     # Buyer leadership
-    if buyer != "NA" and buyer_lead_name != "NA":
-        text = f"{buyer} – {buyer_lead_name}"
-        if buyer_lead_role != "NA":
-            text += f" ({buyer_lead_role})"
+    if esc["buyer"] != "NA" and esc["buyer_lead_name"] != "NA":
+        text = f"{esc['buyer']} – {esc['buyer_lead_name']}"
+        if esc["buyer_lead_role"] != "NA":
+            text += f" ({esc['buyer_lead_role']})"
         labels.append(text)
 
     # Investor leadership (or just firm if no person)
-    if investor_or_pe != "NA":
-        if investor_lead_name != "NA":
-            text = f"{investor_or_pe} – {investor_lead_name}"
-            if investor_lead_role != "NA":
-                text += f" ({investor_lead_role})"
+    if esc["investor_or_pe"] != "NA":
+        if esc["investor_lead_name"] != "NA":
+            text = f"{esc['investor_or_pe']} – {esc['investor_lead_name']}"
+            if esc["investor_lead_role"] != "NA":
+                text += f" ({esc['investor_lead_role']})"
         else:
-            text = f"Investor – {investor_or_pe}"
+            text = f"Investor – {esc['investor_or_pe']}"
         labels.append(text)
 
     # Seller leadership
-    if seller != "NA" and seller_lead_name != "NA":
-        text = f"{seller} – {seller_lead_name}"
-        if seller_lead_role != "NA":
-            text += f" ({seller_lead_role})"
+    if esc["seller"] != "NA" and esc["seller_lead_name"] != "NA":
+        text = f"{esc['seller']} – {esc['seller_lead_name']}"
+        if esc["seller_lead_role"] != "NA":
+            text += f" ({esc['seller_lead_role']})"
         labels.append(text)
 
-    footer_row_html = ""
+    esc["footer_row_html"] = ""
     if labels:
-        items_html = "".join(
-            f'<div class="deal-footer-item">{escape(lbl)}</div>'
-            for lbl in labels
-        )
-        footer_row_html = f"""
-      <div class="deal-footer-row">
-        {items_html}
-      </div>
-    """
+        parts = [_DEAL_FOOTER_OPEN]
+        for lbl in labels:
+            parts.append(f'<div class="deal-footer-item">{lbl}</div>')
+        parts.append(_DEAL_FOOTER_CLOSE)
+        esc["footer_row_html"] = "".join(parts)
 
-    return f"""
-    <div class="deal-block">
-      <div class="deal-title-main">
-        <a href="{url_html}" target="_blank" style="color: #000; text-decoration: none;">
-          {title_html}
-        </a>
-      </div>
-
-      <div class="deal-meta-row">
-        <div class="deal-meta-left">{date_html}</div>
-        <div class="deal-meta-center"><span class="deal-meta-label">Deal Advisor:</span> {deal_advisor}</div>
-        <div class="deal-meta-right"><span class="deal-meta-label">Deal Value:</span> {deal_value}</div>
-      </div>
-
-      <div class="deal-body">{body_html}</div>
-      {footer_row_html}
-    </div>
-    """
+    return _DEAL_TEMPLATE.format_map(esc)
 
 
 # ---------- HTML / TXT OUTPUT ----------
+@functools.lru_cache(maxsize=1)
 def load_template(template_path: Path) -> str:
+    """Read the template once per process; later builds reuse the cached text."""
     with template_path.open("r", encoding="utf-8") as f:
         return f.read()
 
 
-def build_newsletter_html(articles):
-    blocks_html = "\n".join(build_deal_block(a) for a in articles)
+def fill_issue_fields(template_part: str) -> str:
+    # Single pass over the {{NAME}} markers; unknown markers are left untouched
+    fields = {"ISSUE_DATE": ISSUE_DATE, "ISSUE_NUMBER": ISSUE_NUMBER}
+    return _TEMPLATE_FIELD_RE.sub(lambda m: fields.get(m.group(1), m.group(0)), template_part)
+
+
+def write_newsletter_html(articles, output_path: Path):
+    """
+    Stream the newsletter to disk: template head, one deal block per article, template tail.
+    Avoids holding all deal blocks plus the filled template in memory at once.
+    """
     template = load_template(TEMPLATE_PATH)
-    return (
-        template
-        .replace("{{ISSUE_DATE}}", ISSUE_DATE)
-        .replace("{{ISSUE_NUMBER}}", ISSUE_NUMBER)
-        .replace("{{DEAL_BLOCKS}}", blocks_html)
-    )
+    prefix, marker, suffix = template.partition("{{DEAL_BLOCKS}}")
+    if not marker:
+        raise ValueError(f"{TEMPLATE_PATH} has no {{{{DEAL_BLOCKS}}}} marker")
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write(fill_issue_fields(prefix))
+        for idx, article in enumerate(articles):
+            if idx:
+                f.write("\n")
+            f.write(build_deal_block(article))
+        f.write(fill_issue_fields(suffix))
 
 
 def build_context_entry(article: dict) -> str:
@@ -575,37 +691,112 @@ def load_emails_from_file(emails_path: Path) -> list[str]:
     return emails
 
 
-def send_newsletter_email(resend_client: Resend, recipient_email: str, html_content: str, subject: str) -> bool:
+def build_email_params(recipient_email: str, html_content: str, subject: str) -> dict:
+    return {
+        "from": f"{SENDER_NAME} <{SENDER_EMAIL}>",
+        "to": [recipient_email],
+        "subject": subject,
+        "html": html_content,
+    }
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    # resend SDK errors carry the HTTP status as `code` (429) and an `error_type`
+    return str(getattr(e, "code", "")) == "429" or getattr(e, "error_type", "") == "rate_limit_exceeded"
+
+
+def send_batch_with_retry(batch, params_list: list[dict]):
     """
-    Send newsletter email to a single recipient using Resend API.
-    Returns True if successful, False otherwise.
+    Send one Resend batch request, retrying with exponential backoff (1s, 2s, 4s, ...)
+    when it is rejected with HTTP 429. Other errors, or the last failed retry, are raised.
+    """
+    for attempt in range(EMAIL_MAX_RETRIES + 1):
+        try:
+            return batch.send(params_list)
+        except Exception as e:
+            if attempt == EMAIL_MAX_RETRIES or not _is_rate_limit_error(e):
+                raise
+            delay = 2 ** attempt
+            print(f"rate limited, retrying in {delay}s...", end=" ")
+            time.sleep(delay)
+
+
+class AsyncRateLimiter:
     """
+    Spaces request starts at least 1/rate seconds apart across all tasks on the event loop.
+    (A semaphore only caps requests in flight, not requests per second.)
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next = 0.0
+
+    async def wait(self):
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + self._interval
+        await asyncio.sleep(start - now)
+
+
+def _retry_delay(retry_after, attempt: int) -> float:
+    # Honour Retry-After (seconds) when Resend sends it, otherwise back off 1s, 2s, 4s, ...
     try:
-        params = {
-            "from": f"{SENDER_NAME} <{SENDER_EMAIL}>",
-            "to": [recipient_email],
-            "subject": subject,
-            "html": html_content,
-        }
-        
-        response = resend_client.emails.send(params)
-        
-        # Handle different response formats
-        if isinstance(response, dict):
-            email_id = response.get('id') or response.get('data', {}).get('id', 'N/A')
-        else:
-            email_id = getattr(response, 'id', 'N/A')
-        
-        print(f"   ✔ Sent to {recipient_email} (ID: {email_id})")
-        return True
-    except Exception as e:
-        print(f"   ✗ Failed to send to {recipient_email}: {str(e)}")
-        return False
+        return max(float(retry_after), 0.0)
+    except (TypeError, ValueError):
+        return float(2 ** attempt)
+
+
+async def send_newsletter_email_async(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    limiter: AsyncRateLimiter,
+    recipient_email: str,
+    html_content: str,
+    subject: str,
+) -> bool:
+    """
+    Send newsletter email to a single recipient by POSTing to the Resend API.
+    Rate-limited (HTTP 429) attempts are retried up to EMAIL_MAX_RETRIES times.
+    Returns True if successful, False otherwise.
+    """
+    params = build_email_params(recipient_email, html_content, subject)
+    async with sem:
+        for attempt in range(EMAIL_MAX_RETRIES + 1):
+            await limiter.wait()
+            try:
+                async with session.post(RESEND_EMAILS_URL, json=params) as resp:
+                    retry_after = resp.headers.get("Retry-After")
+                    if resp.status != 429 or attempt == EMAIL_MAX_RETRIES:
+                        resp.raise_for_status()
+                        data = await resp.json()
+                        print(f"   ✔ Sent to {recipient_email} (ID: {data.get('id', 'N/A')})")
+                        return True
+            except Exception as e:
+                print(f"   ✗ Failed to send to {recipient_email}: {str(e)}")
+                return False
+            await asyncio.sleep(_retry_delay(retry_after, attempt))
+    return False
+
+
+async def send_newsletters_concurrently(html_content: str, emails: list[str], subject: str) -> list[bool]:
+    """
+    Send one email per recipient, up to EMAIL_CONCURRENCY requests in flight and
+    at most RESEND_RATE_LIMIT request starts per second.
+    Returns per-recipient success flags in the same order as emails.
+    """
+    sem = asyncio.Semaphore(EMAIL_CONCURRENCY)
+    limiter = AsyncRateLimiter(RESEND_RATE_LIMIT)
+    headers = {"Authorization": f"Bearer {RESEND_API_KEY}"}
+    async with aiohttp.ClientSession(headers=headers) as session:
+        return await asyncio.gather(*(
+            send_newsletter_email_async(session, sem, limiter, email, html_content, subject)
+            for email in emails
+        ))
 
 
 def send_newsletters_to_all(html_content: str, emails: list[str], subject: str) -> dict:
     """
-    Send newsletter to all email addresses.
+    Send newsletter to all email addresses, up to EMAIL_BATCH_SIZE per Resend batch request.
     Returns a dictionary with success/failure statistics.
     """
     if not RESEND_API_KEY:
@@ -621,14 +812,31 @@ def send_newsletters_to_all(html_content: str, emails: list[str], subject: str)
     success_count = 0
     failed_count = 0
     
-    for idx, email in enumerate(emails, start=1):
-        print(f"[{idx}/{len(emails)}] Sending to {email}...", end=" ")
-        if send_newsletter_email(resend_client, email, html_content, subject):
-            success_count += 1
-        else:
-            failed_count += 1
-        # Small delay to avoid rate limiting
-        time.sleep(0.5)
+    batch = getattr(resend_client, "batch", None)
+    if batch is None:
+        # Older SDKs without batch support: one request per recipient, sent concurrently
+        results = asyncio.run(send_newsletters_concurrently(html_content, emails, subject))
+        success_count = sum(results)
+        failed_count = len(results) - success_count
+    else:
+        # Space batch calls to stay within RESEND_RATE_LIMIT requests per second
+        min_interval = 1 / RESEND_RATE_LIMIT
+        last_sent = 0.0
+        for start in range(0, len(emails), EMAIL_BATCH_SIZE):
+            chunk = emails[start:start + EMAIL_BATCH_SIZE]
+            print(f"[{start + 1}-{start + len(chunk)}/{len(emails)}] Sending batch...", end=" ")
+            wait = last_sent + min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                send_batch_with_retry(batch, [build_email_params(email, html_content, subject) for email in chunk])
+                print(f"✔ {len(chunk)} sent")
+                success_count += len(chunk)
+            except Exception as e:
+                print(f"✗ Batch failed: {str(e)}")
+                failed_count += len(chunk)
+            # Measured from the last attempt, so retries count against the limit too
+            last_sent = time.monotonic()
     
     print(f"\n📊 Email sending summary:")
     print(f"   ✅ Successful: {success_count}")
@@ -642,6 +850,30 @@ def send_newsletters_to_all(html_content: str, emails: list[str], subject: str)
     }
 
 
+# ---------- CONCURRENT ENRICHMENT ----------
+def _process_one(item) -> dict:
+    idx, total, article = item
+    start = time.time()
+    extracted = ai_extract_all(article)
+    print(f"=== [{idx}/{total}] {article.get('title','Untitled')[:70]}")
+    print(f"   ✔ Summary + metadata OK ({time.time() - start:.1f}s)\n")
+    return {
+        **article,
+        **extracted,
+    }
+
+
+def enrich_articles(articles: list[dict]) -> list[dict]:
+    """
+    Run the combined summary + metadata extraction for all articles on a thread pool of
+    OLLAMA_NUM_PARALLEL workers (the work is blocking HTTP). Output order matches input order.
+    """
+    total = len(articles)
+    items = [(idx, total, article) for idx, article in enumerate(articles, start=1)]
+    with ThreadPoolExecutor(max_workers=OLLAMA_NUM_PARALLEL) as ex:
+        return list(ex.map(_process_one, items))
+
+
 # ---------- MAIN ----------
 def main():
     articles = load_articles(JSON_PATH)
@@ -653,28 +885,9 @@ def main():
     else:
         print(f"Found {total_raw} articles\n")
 
-    enriched = []
-
-    for idx, article in enumerate(articles, start=1):
-        print(f"=== [{idx}/{len(articles)}] {article.get('title','Untitled')[:70]}")
-
-        start = time.time()
-        context = get_context_text(article)
-        print(f"   ✔ Summary OK ({time.time() - start:.1f}s)")
-
-        print("   🔍 Extracting deal metadata...")
-        start = time.time()
-        meta = ai_extract_deal_metadata(article.get("content", "") or "")
-        print(f"   ✔ Metadata OK ({time.time() - start:.1f}s)\n")
-
-        enriched.append({
-            **article,
-            "context": context,
-            **meta,
-        })
+    enriched = enrich_articles(articles)
 
-    html = build_newsletter_html(enriched)
-    HTML_OUTPUT_PATH.write_text(html, encoding="utf-8")
+    write_newsletter_html(enriched, HTML_OUTPUT_PATH)
     print(f"\n📄 HTML: {HTML_OUTPUT_PATH.resolve()}")
 
     contexts = build_contexts_text(enriched)
@@ -685,6 +898,7 @@ def main():
     if SEND_EMAILS:
         emails = load_emails_from_file(EMAILS_FILE_PATH)
         if emails:
+            html = HTML_OUTPUT_PATH.read_text(encoding="utf-8")
             send_newsletters_to_all(html, emails, EMAIL_SUBJECT)
         else:
             print("\n⚠️  No emails found to send. Please check emails.txt file.")